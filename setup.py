@@ -5,11 +5,13 @@ setup(
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"ekiti.data": ["*.json"]},
     install_requires=[
         "typer>=0.9.0",
         "rich>=13.0.0",
         "pydantic>=2.0.0",
         "pyyaml>=6.0",
+        "orjson>=3.8.0",
         "sqlmodel>=0.0.8",
         "python-dotenv>=1.0.0"
     ],
@@ -1,34 +1,93 @@
-import csv
-import random
+from __future__ import annotations
+
 import sys
-import time
-from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
-from rich.console import Console
-from rich.prompt import Confirm, IntPrompt, Prompt, PromptBase
-from rich.table import Table
 
-from ekiti.core.quiz import QuizDirection, QuizMode, QuizSession
-from ekiti.core.storage import StorageManager
-from ekiti.models.word import Example, LanguageCode, WordDetails, WordEntry
+# Everything else is imported inside the commands that need it, so that
+# `ekiti --help` and shell completion stay fast.
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    
+    from ekiti.core.quiz import QuizQuestion, QuizSession
+    from ekiti.core.storage import BaseStorage, StorageManager
+    from ekiti.models.word import WordDetails, WordEntry
+
+class Lang(str, Enum):
+    """Languages offered by the CLI, in menu order."""
+    de = "de"
+    es = "es"
+    id = "id"
+    taigi = "taigi"
+
+_SUPPORTED_LANGS = tuple(lang.value for lang in Lang)
+_LANGUAGE_NAMES = ("German (de)", "Spanish (es)", "Indonesian (id)", "Taigi (taigi)")
+
+# Selection menus, rendered once and printed with a single call
+_LANGUAGE_MENU = "\n[bold]Select a language:[/bold]\n" + "\n".join(
+    f"  {name}" for name in _LANGUAGE_NAMES
+)
+_QUIZ_MODE_MENU = "\n[bold]Select quiz mode:[/bold]\n  1. Multiple Choice\n  2. Spelling"
+_QUIZ_DIRECTION_MENU = (
+    "\n[bold]Select quiz direction:[/bold]\n"
+    "  1. Word → Translation\n"
+    "  2. Translation → Word"
+)
+_QUIZ_MODES = {"1": "multiple_choice", "2": "spelling"}
+_QUIZ_DIRECTIONS = {"1": "target_to_english", "2": "english_to_target"}
+
+# Longest translation shown in the word list before it is cut off
+_MAX_TRANSLATION_WIDTH = 30
+
+# Languages with grammatical gender
+_GENDERED_LANGS = frozenset({"de", "es"})
+
+# Number of CSV rows buffered before they are written in one go
+IMPORT_BATCH_SIZE = 500
 
 app = typer.Typer()
-console = Console()
-storage = StorageManager()
+
+class _LazyConsole:
+    """Stand-in that replaces itself with a rich Console on first use."""
+    
+    def __getattr__(self, name: str):
+        global console
+        from rich.console import Console
+        console = Console(soft_wrap=True, highlight=False)
+        return getattr(console, name)
+    
+    def __enter__(self):
+        return self.__getattr__("__enter__")()
+    
+    def __exit__(self, *exc_info):
+        return console.__exit__(*exc_info)
+
+console = _LazyConsole()
+_storage: Optional[StorageManager] = None
+_prefs_cache: Optional[Dict[str, Any]] = None
+
+def _get_storage() -> StorageManager:
+    """Return the shared StorageManager, creating it on first use."""
+    global _storage
+    if _storage is None:
+        from ekiti.core.storage import StorageManager
+        _storage = StorageManager()
+    return _storage
 
 # Helper functions
 def display_word(word: WordEntry):
     """Display a word entry in a formatted way."""
-    console.print(f"\n[bold blue]{word.word}[/bold blue]")
+    from rich.console import Group
+    
+    parts = [f"\n[bold blue]{word.word}[/bold blue]"]
     
     # Display translations
     if word.translations:
-        console.print("\n[bold]Translations:[/bold]")
-        for lang, text in word.translations.items():
-            console.print(f"  {lang.upper()}: {text}")
+        parts.append("\n[bold]Translations:[/bold]")
+        parts.extend(f"  {lang.upper()}: {text}" for lang, text in word.translations.items())
     
     # Display details
     if word.details:
@@ -38,69 +97,107 @@ def display_word(word: WordEntry):
         if word.details.plural:
             details.append(f"Plural: {word.details.plural}")
         if details:
-            console.print("\n" + " | ".join(details))
+            parts.append("\n" + " | ".join(details))
     
     # Display examples
     if word.examples:
-        console.print("\n[bold]Examples:[/bold]")
+        parts.append("\n[bold]Examples:[/bold]")
         for i, example in enumerate(word.examples, 1):
-            console.print(f"  {i}. {example.sentence}")
-            console.print(f"     → {example.translation}")
+            parts.append(f"  {i}. {example.sentence}\n     → {example.translation}")
     
     if word.tags:
-        console.print("\n" + " ".join(f"[dim]#{tag}[/dim]" for tag in word.tags))
+        parts.append("\n" + " ".join(f"[dim]#{tag}[/dim]" for tag in word.tags))
+    
+    console.print(Group(*parts))
+
+def _truncate(text: str, width: int = _MAX_TRANSLATION_WIDTH) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "…"
+
+def _prefs_path() -> Path:
+    return Path.home() / ".config" / "ekiti" / "prefs.json"
+
+def _prefs() -> Dict[str, Any]:
+    """Return the saved preferences; the prefs file is read once per process."""
+    global _prefs_cache
+    if _prefs_cache is None:
+        import orjson
+        try:
+            prefs = orjson.loads(_prefs_path().read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            prefs = None
+        # Anything but a JSON object is treated as no saved preferences
+        _prefs_cache = prefs if isinstance(prefs, dict) else {}
+    return _prefs_cache
+
+def _load_pref(key: str) -> Optional[str]:
+    """Return a saved preference."""
+    return _prefs().get(key)
+
+def _save_pref(key: str, value: str) -> None:
+    """Persist a preference if it changed."""
+    import orjson
+    
+    prefs = _prefs()
+    if prefs.get(key) == value:
+        return
+    prefs[key] = value
+    path = _prefs_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(prefs))
 
 def select_language() -> str:
     """Prompt user to select a language."""
-    languages = ["German (de)", "Spanish (es)", "Indonesian (id)", "Taigi (taigi)"]
-    console.print("\n[bold]Select a language:[/bold]")
-    for i, lang in enumerate(languages, 1):
-        console.print(f"  {i}. {lang}")
+    from rich.prompt import Prompt
     
-    while True:
-        try:
-            choice = IntPrompt.ask("\nEnter your choice", default=1, show_default=True)
-            if 1 <= choice <= len(languages):
-                return languages[choice - 1].split("(")[1].strip(" )")
-            console.print("[red]Invalid choice. Please try again.[/red]")
-        except ValueError:
-            console.print("[red]Please enter a number.[/red]")
+    console.print(_LANGUAGE_MENU)
+    
+    # Offer the language picked last time, so Enter is enough to reuse it
+    default = _load_pref("last_language")
+    if default not in _SUPPORTED_LANGS:
+        default = _SUPPORTED_LANGS[0]
+    
+    language = Prompt.ask(
+        "\nLanguage",
+        choices=list(_SUPPORTED_LANGS),
+        default=default
+    )
+    _save_pref("last_language", language)
+    return language
 
 def select_quiz_mode() -> str:
     """Prompt user to select quiz mode."""
-    console.print("\n[bold]Select quiz mode:[/bold]")
-    console.print("  1. Multiple Choice")
-    console.print("  2. Spelling")
+    from rich.prompt import Prompt
     
+    console.print(_QUIZ_MODE_MENU)
     while True:
         choice = Prompt.ask("\nEnter your choice", default="1")
-        if choice == "1":
-            return "multiple_choice"
-        elif choice == "2":
-            return "spelling"
+        if choice in _QUIZ_MODES:
+            return _QUIZ_MODES[choice]
         console.print("[red]Invalid choice. Please enter 1 or 2.[/red]")
 
 def select_quiz_direction() -> str:
     """Prompt user to select quiz direction."""
-    console.print("\n[bold]Select quiz direction:[/bold]")
-    console.print("  1. Word → Translation")
-    console.print("  2. Translation → Word")
+    from rich.prompt import Prompt
     
+    console.print(_QUIZ_DIRECTION_MENU)
     while True:
         choice = Prompt.ask("\nEnter your choice", default="1")
-        if choice == "1":
-            return "target_to_english"
-        elif choice == "2":
-            return "english_to_target"
+        if choice in _QUIZ_DIRECTIONS:
+            return _QUIZ_DIRECTIONS[choice]
         console.print("[red]Invalid choice. Please enter 1 or 2.[/red]")
 
 # CLI Commands
 def _prompt_word_details(language: str) -> WordDetails:
     """Prompt for word details based on language."""
+    from rich.prompt import Confirm, Prompt
+    
+    from ekiti.models.word import WordDetails
+    
     details = WordDetails()
     
     # Only ask for gender and plural for languages that need it
-    if language in ["de", "es"]:  # German and Spanish have grammatical gender
+    if language in _GENDERED_LANGS:
         details.gender = Prompt.ask(
             "Gender (m/f/n for masculine/feminine/neuter)", 
             choices=["m", "f", "n", ""], 
@@ -121,19 +218,34 @@ def _prompt_word_details(language: str) -> WordDetails:
     
     return details
 
-def _add_word(word: str, translation: str, language: str, trans_lang: str = "en") -> WordEntry:
-    """Helper function to add a word with translation."""
-    word_entry = WordEntry(
+def _new_word(word: str, translation: str, language: str, trans_lang: str = "en") -> WordEntry:
+    """Build an unsaved word entry with a single translation."""
+    from ekiti.models.word import WordDetails, WordEntry
+    
+    return WordEntry(
         word=word.strip(),
         language=language,
         translations={trans_lang: translation.strip()},
         details=WordDetails()
     )
-    return storage.get_storage(language).save(word_entry)
+
+def _add_word(
+    lang_storage: BaseStorage[WordEntry],
+    word: str,
+    translation: str,
+    language: str,
+    trans_lang: str = "en"
+) -> WordEntry:
+    """Helper function to add a word with translation."""
+    return lang_storage.save(_new_word(word, translation, language, trans_lang))
 
 @app.command()
 def import_csv():
     """Import words from a CSV file."""
+    import csv
+    
+    from rich.prompt import Prompt
+    
     console.print("\n[bold]Import Words from CSV[/bold]")
     
     # Get CSV file path
@@ -154,6 +266,8 @@ def import_csv():
     ).lower()
     
     # Process CSV file
+    lang_storage = _get_storage().get_storage(language)
+    batch: List[WordEntry] = []
     imported = 0
     skipped = 0
     
@@ -176,17 +290,28 @@ def import_csv():
                 translation = ", ".join(translations)
                 
                 try:
-                    _add_word(word, translation, language, trans_lang)
-                    imported += 1
-                    console.print(f"[green]✓[/green] Added: {word} → {translation}")
+                    batch.append(_new_word(word, translation, language, trans_lang))
                 except Exception as e:
                     console.print(f"[red]✗ Error adding {word}: {str(e)}[/red]")
                     skipped += 1
+                    continue
+                
+                # Write full batches and report progress once per batch
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    imported += len(lang_storage.save_many(batch))
+                    batch.clear()
+                    console.print(f"[dim]Imported {imported} words...[/dim]")
+            
+            if batch:
+                imported += len(lang_storage.save_many(batch))
     
     except Exception as e:
         console.print(f"[red]Error reading CSV file: {str(e)}[/red]")
         return
     
+    # Saves are written in the background; surface write errors before
+    # claiming success
+    lang_storage.flush()
     console.print(f"\n[bold]Import complete![/bold]")
     console.print(f"Imported: {imported}")
     console.print(f"Skipped: {skipped}")
@@ -194,10 +319,15 @@ def import_csv():
 @app.command()
 def add():
     """Add a new word to the dictionary."""
+    from rich.prompt import Confirm, Prompt
+    
+    from ekiti.models.word import Example
+    
     console.print("\n[bold]Add a New Word[/bold]")
     
     # Get word and language
     language = select_language()
+    lang_storage = _get_storage().get_storage(language)
     word = Prompt.ask("\nEnter the word")
     
     # Get translation
@@ -208,7 +338,7 @@ def add():
     translation = Prompt.ask(f"Enter '{word}' in {trans_lang.upper()}")
     
     # Create word entry
-    word_entry = _add_word(word, translation, language, trans_lang)
+    word_entry = _add_word(lang_storage, word, translation, language, trans_lang)
     
     # Add word details
     if Confirm.ask("\nAdd word details?"):
@@ -219,95 +349,232 @@ def add():
         tags_input = Prompt.ask("Enter tags (comma-separated)")
         word_entry.tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()]
     
-    # Add examples
-    while Confirm.ask("\nAdd an example sentence?"):
-        sentence = Prompt.ask("Enter example sentence")
-        translation = Prompt.ask("Enter translation")
-        word_entry.examples.append(
-            Example(sentence=sentence, translation=translation)
-        )
+    # Add examples, one "sentence | translation" per line
+    console.print(
+        "\nEnter example sentences as [bold]sentence | translation[/bold], "
+        "one per line (leave blank to finish):"
+    )
+    for line in iter(lambda: console.input("> ").strip(), ""):
+        sentence, _, translation = (part.strip() for part in line.partition("|"))
+        if not sentence or not translation:
+            console.print("[yellow]Skipped: use 'sentence | translation'.[/yellow]")
+            continue
+        word_entry.examples.append(Example(sentence=sentence, translation=translation))
     
     # Save the final entry
-    storage.get_storage(language).save(word_entry)
+    lang_storage.save(word_entry)
+    lang_storage.flush()
     console.print(f"\n[green]✓ Added: {word_entry.word}[/green]")
 
 @app.command()
-def list_words(language: str = None):
+def list_words(language: Optional[Lang] = None):
     """List all words in the dictionary."""
+    from rich.style import Style
+    from rich.table import Table
+    from rich.text import Text
+    
     console.print("\n[bold]Word List[/bold]")
     
     # Get storage for the specified language or all languages
     if language:
-        storages = {language: storage.get_storage(language)}
+        storages = {language.value: _get_storage().get_storage(language.value)}
     else:
         storages = {
-            lang: storage.get_storage(lang) 
-            for lang in ["de", "es", "id", "taigi"]
+            lang: _get_storage().get_storage(lang) 
+            for lang in _SUPPORTED_LANGS
         }
     
-    # Create and display table
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Language")
+    # Cells are plain Text, so Rich never scans word data for markup
+    word_style = Style(color="cyan")
+    rows = [
+        (
+            Text(lang.upper()),
+            Text(word, style=word_style),
+            Text(_truncate(translation or "No translation")),
+            Text(f"{familiarity*100:.0f}%" if familiarity else "-"),
+            Text(last_practiced.strftime("%Y-%m-%d") if last_practiced else "Never")
+        )
+        for lang, store in storages.items()
+        for word, translation, familiarity, last_practiced in store.list_summary()
+    ]
+    
+    # Create and display table; fixed-format columns get fixed widths
+    table = Table(show_header=True, header_style="bold magenta", expand=False)
+    table.add_column("Language", min_width=8, max_width=8)
     table.add_column("Word")
-    table.add_column("Translation")
-    table.add_column("Familiarity")
-    table.add_column("Last Practiced")
-    
-    for lang, store in storages.items():
-        for word_entry in store.list():
-            # Get primary translation (usually English)
-            translation = word_entry.translations.get("en", "No translation")
-            
-            # Format familiarity
-            familiarity = f"{word_entry.familiarity*100:.0f}%" if word_entry.familiarity else "-"
-            
-            # Format last practiced date
-            last_practiced = (
-                word_entry.last_practiced.strftime("%Y-%m-%d") 
-                if word_entry.last_practiced 
-                else "Never"
-            )
-            
-            table.add_row(
-                lang.upper(),
-                word_entry.word,
-                translation[:30] + ("..." if len(translation) > 30 else ""),
-                familiarity,
-                last_practiced
-            )
+    table.add_column("Translation", max_width=_MAX_TRANSLATION_WIDTH + 1)
+    table.add_column("Familiarity", min_width=11, max_width=11)
+    table.add_column("Last Practiced", min_width=14, max_width=14)
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
+    console.print(table, markup=False, emoji=False, highlight=False)
+
+@app.command()
+def export_yaml(language: Lang, output: Optional[Path] = None):
+    """Export a language's words to a human-readable YAML file."""
+    output = output or Path(f"{language.value}.yaml")
+    _get_storage().get_storage(language.value).export_yaml(str(output))
+    console.print(f"[green]✓ Exported {language.value.upper()} words to {output}[/green]")
 
 def show_help():
     """Show available commands during the quiz."""
-    console.print("\n[bold]Available Commands:[/bold]")
-    console.print("  [bold]h[/bold] - Show this help")
-    console.print("  [bold]s[/bold] - Skip this word")
-    console.print("  [bold]?[/bold] - Get a hint")
-    console.print("  [bold]u[/bold] - Mark as unfamiliar")
-    console.print("  [bold]q[/bold] - Quit the quiz")
-    console.print("  [bold]your answer[/bold] - Submit your answer\n")
+    console.print(
+        "\n[bold]Available Commands:[/bold]\n"
+        "  [bold]h[/bold] - Show this help\n"
+        "  [bold]s[/bold] - Skip this word\n"
+        "  [bold]?[/bold] - Get a hint\n"
+        "  [bold]u[/bold] - Mark as unfamiliar\n"
+        "  [bold]q[/bold] - Quit the quiz\n"
+        "  [bold]your answer[/bold] - Submit your answer\n"
+    )
+
+# What the quiz loop should do after a command has run
+_REPROMPT, _NEXT_QUESTION, _ABORT = range(3)
+
+def _cmd_help(session: QuizSession) -> int:
+    show_help()
+    return _REPROMPT
+
+def _cmd_skip(session: QuizSession) -> int:
+    session.skip_question()
+    console.print("[yellow]Question skipped.[/yellow]")
+    return _NEXT_QUESTION
+
+def _cmd_hint(session: QuizSession) -> int:
+    console.print(f"[blue]{session.get_hint()}[/blue]")
+    return _REPROMPT
+
+def _cmd_unfamiliar(session: QuizSession) -> int:
+    session.mark_current_as_unfamiliar()
+    console.print("[yellow]Word marked as unfamiliar.[/yellow]")
+    return _REPROMPT
+
+def _cmd_quit(session: QuizSession) -> int:
+    from rich.prompt import Confirm
+    
+    if Confirm.ask("\nAre you sure you want to quit the quiz?"):
+        console.print("\n[bold]Quiz aborted.[/bold]")
+        return _ABORT
+    return _REPROMPT
+
+# Quiz commands keyed by the (lowercased) input that triggers them
+_QUIZ_COMMANDS = {
+    "h": _cmd_help,
+    "s": _cmd_skip,
+    "?": _cmd_hint,
+    "u": _cmd_unfamiliar,
+    "q": _cmd_quit,
+}
+
+def _getch() -> str:
+    """Read a single key press from the terminal without waiting for Enter."""
+    if sys.platform == "win32":
+        import msvcrt
+        
+        key = msvcrt.getwch()
+        if key == "\x03":  # Ctrl-C is not turned into SIGINT by getwch
+            raise KeyboardInterrupt
+        return key
+    
+    import termios
+    import tty
+    
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _ask_key(prompt: str) -> str:
+    """Prompt for a single key press and echo it."""
+    console.print(f"{prompt}: ", end="")
+    key = _getch()
+    console.print(key, markup=False)
+    return key
+
+def _handle_quiz_input(
+    session: QuizSession, question: QuizQuestion, allow_numeric: bool
+) -> Optional[str]:
+    """Read input until the question is answered or skipped.
+    
+    With allow_numeric the input is parsed as a 1-based index into the
+    question's options. Returns the answer feedback for the caller to
+    print with its next output ("" if the question was skipped), or None
+    if the user aborted the quiz.
+    """
+    from rich.prompt import Prompt
+    
+    prompt = (
+        "\nEnter your answer (number) or command"
+        if allow_numeric
+        else "\nType your answer or command"
+    )
+    
+    # Up to nine options can be answered with a single key press
+    single_key = allow_numeric and len(question.options) <= 9 and sys.stdin.isatty()
+    if single_key:
+        prompt = "\nPress the answer number or a command key"
+    
+    while True:
+        try:
+            user_input = _ask_key(prompt) if single_key else Prompt.ask(prompt)
+        except KeyboardInterrupt:
+            if _cmd_quit(session) == _ABORT:
+                return None
+            continue
+        
+        # Handle commands
+        command = _QUIZ_COMMANDS.get(user_input.lower())
+        if command:
+            outcome = command(session)
+            if outcome == _REPROMPT:
+                continue
+            return None if outcome == _ABORT else ""
+        
+        # Process answer
+        answer = user_input
+        if allow_numeric:
+            try:
+                answer_idx = int(user_input) - 1
+            except ValueError:
+                console.print("[red]Please enter a valid number or command.[/red]")
+                continue
+            if not 0 <= answer_idx < len(question.options):
+                console.print(f"[red]Please enter a number between 1 and {len(question.options)}[/red]")
+                continue
+            answer = question.options[answer_idx]
+        
+        if session.submit_answer(answer):
+            return "[green]✓ Correct![/green]"
+        return f"[red]✗ Incorrect. The correct answer is: {question.correct_answer}[/red]"
 
 @app.command()
 def quiz(
-    language: str = None,
+    language: Optional[Lang] = None,
     mode: str = None,
     direction: str = None,
     num_questions: int = 10
 ):
     """Start a vocabulary quiz."""
+    from rich.console import Group
+    from rich.text import Text
+    
+    from ekiti.core.quiz import QuizSession
+    
     console.print("\n[bold]Vocabulary Quiz[/bold]")
     
     # Get quiz parameters
-    if not language:
-        language = select_language()
+    lang_code = language.value if language else select_language()
     if not mode:
         mode = select_quiz_mode()
     if not direction:
         direction = select_quiz_direction()
     
     # Get words for the quiz
-    words = storage.get_storage(language).list()
+    words = _get_storage().get_storage(lang_code).list()
     if not words:
         console.print("[red]No words found in the dictionary.[/red]")
         return
@@ -320,107 +587,46 @@ def quiz(
         num_questions=min(num_questions, len(words))
     )
     
-    console.print(f"\nStarting {mode.replace('_', ' ').title()} Quiz ({direction})")
-    console.print(f"Language: {language.upper()} | Questions: {len(session.questions)}")
-    console.print("\nType 'h' during the quiz to see available commands.")
+    console.print(
+        f"\nStarting {mode.replace('_', ' ').title()} Quiz ({direction})\n"
+        f"Language: {lang_code.upper()} | Questions: {len(session.questions)}\n"
+        "\nType 'h' during the quiz to see available commands."
+    )
     
-    # Ask questions
+    # Ask questions. Feedback on an answer is held back and written out
+    # together with the next question, so each turn is a single write.
+    feedback: Optional[str] = ""
     while not session.is_complete():
         question = session.get_next_question()
         if not question:
             break
         
+        # Print the whole question block at once; options are plain text
         current, total = session.get_progress()
-        console.print(f"\n[dim]Question {current} of {total}[/dim]")
-        console.print(f"\n[bold]{question.question}[/bold]")
-        
+        block: List[RenderableType] = [feedback] if feedback else []
+        block += [
+            f"\n[dim]Question {current} of {total}[/dim]",
+            f"\n[bold]{question.question}[/bold]"
+        ]
         if question.question_type == "multiple_choice":
-            for i, option in enumerate(question.options, 1):
-                console.print(f"  {i}. {option}")
-            
-            while True:
-                try:
-                    user_input = Prompt.ask("\nEnter your answer (number) or command")
-                    
-                    # Handle commands
-                    if user_input.lower() == 'h':
-                        show_help()
-                        continue
-                    elif user_input.lower() == 's':  # Skip
-                        session.skip_question()
-                        console.print("[yellow]Question skipped.[/yellow]")
-                        break
-                    elif user_input == '?':  # Hint
-                        hint = session.get_hint()
-                        console.print(f"[blue]{hint}[/blue]")
-                        continue
-                    elif user_input.lower() == 'u':  # Mark as unfamiliar
-                        session.mark_current_as_unfamiliar()
-                        console.print("[yellow]Word marked as unfamiliar.[/yellow]")
-                        continue
-                    elif user_input.lower() == 'q':  # Quit
-                        if Confirm.ask("\nAre you sure you want to quit the quiz?"):
-                            console.print("\n[bold]Quiz aborted.[/bold]")
-                            return
-                        continue
-                    
-                    # Process answer
-                    try:
-                        answer_idx = int(user_input) - 1
-                        if 0 <= answer_idx < len(question.options):
-                            answer = question.options[answer_idx]
-                            is_correct = session.submit_answer(answer)
-                            
-                            if is_correct:
-                                console.print("[green]✓ Correct![/green]")
-                            else:
-                                console.print(f"[red]✗ Incorrect. The correct answer is: {question.correct_answer}[/red]")
-                            break
-                        console.print(f"[red]Please enter a number between 1 and {len(question.options)}[/red]")
-                    except ValueError:
-                        console.print("[red]Please enter a valid number or command.[/red]")
-                        
-                except KeyboardInterrupt:
-                    if Confirm.ask("\nAre you sure you want to quit the quiz?"):
-                        console.print("\n[bold]Quiz aborted.[/bold]")
-                        return
-                    continue
+            block.append(Text("\n".join(
+                f"  {i}. {option}" for i, option in enumerate(question.options, 1)
+            )))
+        console.print(Group(*block))
         
-        else:  # spelling mode
-            while True:
-                user_input = Prompt.ask("\nType your answer or command")
-                
-                # Handle commands
-                if user_input.lower() == 'h':
-                    show_help()
-                    continue
-                elif user_input.lower() == 's':  # Skip
-                    session.skip_question()
-                    console.print("[yellow]Question skipped.[/yellow]")
-                    break
-                elif user_input == '?':  # Hint
-                    hint = session.get_hint()
-                    console.print(f"[blue]{hint}[/blue]")
-                    continue
-                elif user_input.lower() == 'u':  # Mark as unfamiliar
-                    session.mark_current_as_unfamiliar()
-                    console.print("[yellow]Word marked as unfamiliar.[/yellow]")
-                    continue
-                elif user_input.lower() == 'q':  # Quit
-                    if Confirm.ask("\nAre you sure you want to quit the quiz?"):
-                        console.print("\n[bold]Quiz aborted.[/bold]")
-                        return
-                    continue
-                
-                # Process answer
-                is_correct = session.submit_answer(user_input)
-                if is_correct:
-                    console.print("[green]✓ Correct![/green]")
-                else:
-                    console.print(f"[red]✗ Incorrect. The correct answer is: {question.correct_answer}[/red]")
-                break
-    
-    # Show results
+        allow_numeric = question.question_type == "multiple_choice"
+        feedback = _handle_quiz_input(session, question, allow_numeric)
+        if feedback is None:
+            return
+    
+    # Show results, buffered into one write
+    with console:
+        _show_results(session, feedback)
+
+def _show_results(session: QuizSession, feedback: Optional[str]) -> None:
+    """Print the quiz results and save words marked as unfamiliar."""
+    if feedback:
+        console.print(feedback)
     results = session.get_results()
     console.print("\n[bold]Quiz Complete![/bold]")
     console.print(f"Score: {results['correct_answers']}/{results['total_questions']} ({results['score_percentage']:.1f}%)")
@@ -431,21 +637,24 @@ def quiz(
     if skipped:
         console.print("\n[yellow]Skipped words:[/yellow]")
         for q in skipped:
-            console.print(f"- {q.word.word} ({q.word.translations.get('en', 'No translation')})")
+            console.print(f"- {q.word.word} ({q.word.en_translation or 'No translation'})")
     
     unfamiliar = session.get_unfamiliar_words()
     if unfamiliar:
         console.print("\n[yellow]Words marked as unfamiliar:[/yellow]")
         for word in unfamiliar:
-            console.print(f"- {word.word} ({word.translations.get('en', 'No translation')})")
+            console.print(f"- {word.word} ({word.en_translation or 'No translation'})")
     
     # Save unfamiliar words to a list for review
     if unfamiliar:
         review_file = Path.home() / ".config" / "ekiti" / "unfamiliar_words.txt"
         review_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(review_file, "a", encoding="utf-8") as f:
-            for word in unfamiliar:
-                f.write(f"{word.word} - {word.translations.get('en', 'No translation')}\n")
+        lines = [
+            f"{word.word} - {word.en_translation or 'No translation'}\n"
+            for word in unfamiliar
+        ]
+        with open(review_file, "a", encoding="utf-8", buffering=8192) as f:
+            f.writelines(lines)
         console.print(f"\n[green]Unfamiliar words have been saved to {review_file}[/green]")
 
 @app.callback()
@@ -1,5 +1,6 @@
 from typing import List, Dict, Optional, Tuple, Literal
 import random
+import time
 from datetime import datetime
 
 from ekiti.models.word import WordEntry, LanguageCode
@@ -10,6 +11,13 @@ QuizDirection = Literal["target_to_english", "english_to_target"]
 class QuizQuestion:
     """Represents a quiz question."""
     
+    # One instance per question; fixed slots avoid a per-instance __dict__
+    __slots__ = (
+        "word", "question", "correct_answer", "options", "question_type",
+        "direction", "user_answer", "answered_correctly", "skipped",
+        "unfamiliar", "hint_shown", "resolved", "_hint",
+    )
+    
     def __init__(
         self, 
         word: WordEntry,
@@ -30,17 +38,21 @@ class QuizQuestion:
         self.skipped: bool = False
         self.unfamiliar: bool = False
         self.hint_shown: bool = False
+        self.resolved: bool = False  # answered or skipped
+        self._hint: Optional[str] = None  # built on first request
     
     def submit_answer(self, answer: str) -> bool:
         """Submit an answer and return if it's correct."""
         self.user_answer = answer
         self.answered_correctly = (answer == self.correct_answer)
+        self.resolved = True
         return self.answered_correctly
     
     def skip(self) -> None:
         """Mark this question as skipped."""
         self.skipped = True
         self.answered_correctly = False
+        self.resolved = True
     
     def mark_unfamiliar(self) -> None:
         """Mark this word as unfamiliar."""
@@ -49,6 +61,12 @@ class QuizQuestion:
     def show_hint(self) -> str:
         """Show a hint for this question."""
         self.hint_shown = True
+        if self._hint is None:
+            self._hint = self._build_hint()
+        return self._hint
+    
+    def _build_hint(self) -> str:
+        """Build the hint text; the same hint is reused for repeat requests."""
         if self.question_type == "multiple_choice":
             # For multiple choice, show half of the options (rounded up)
             num_to_show = (len(self.options) + 1) // 2
@@ -79,30 +97,37 @@ class QuizSession:
         self.questions: List[QuizQuestion] = []
         self.current_question_index = -1
         self.score = 0
-        self.start_time = datetime.utcnow()
+        self._resolved = 0  # number of questions answered or skipped
+        self.start_time = datetime.utcnow()  # wall clock, for display/records
+        self._t0 = time.perf_counter()  # monotonic, for measuring duration
         self._generate_questions()
     
     def _generate_questions(self) -> None:
         """Generate quiz questions based on the selected mode and direction."""
-        # Select random words for the quiz
-        selected_words = random.sample(self.words, self.num_questions)
+        to_english = self.direction == "target_to_english"
         
-        for word in selected_words:
-            if self.direction == "target_to_english":
+        # Every word's answer, computed once and shared by all questions
+        answers = [
+            w.en_translation if to_english else w.word
+            for w in self.words
+        ]
+        num_distractors = min(3, len(self.words) - 1)
+        
+        # Select random words for the quiz
+        for word_idx in random.sample(range(len(self.words)), self.num_questions):
+            word = self.words[word_idx]
+            if to_english:
                 question = word.word
-                correct_answer = word.translations.get("en", "No English translation")
+                correct_answer = word.en_translation or "No English translation"
             else:
-                question = word.translations.get("en", "No English translation")
+                question = word.en_translation or "No English translation"
                 correct_answer = word.word
             
             if self.mode == "multiple_choice":
-                # Generate incorrect options
-                other_words = [w for w in self.words if w != word]
-                other_answers = [
-                    w.translations.get("en", "") if self.direction == "target_to_english" else w.word 
-                    for w in random.sample(other_words, min(3, len(other_words)))
-                ]
-                options = [correct_answer] + other_answers
+                # Draw one spare index in case the question's own word comes up
+                pool = random.sample(range(len(self.words)), num_distractors + 1)
+                distractors = [i for i in pool if i != word_idx][:num_distractors]
+                options = [correct_answer] + [answers[i] for i in distractors]
                 random.shuffle(options)
             else:
                 options = []
@@ -132,6 +157,8 @@ class QuizSession:
     def submit_answer(self, answer: str) -> bool:
         """Submit an answer for the current question."""
         question = self.questions[self.current_question_index]
+        if not question.resolved:
+            self._resolved += 1
         is_correct = question.submit_answer(answer)
         if is_correct:
             self.score += 1
@@ -140,7 +167,10 @@ class QuizSession:
     def skip_question(self) -> None:
         """Skip the current question."""
         if 0 <= self.current_question_index < len(self.questions):
-            self.questions[self.current_question_index].skip()
+            question = self.questions[self.current_question_index]
+            if not question.resolved:
+                self._resolved += 1
+            question.skip()
     
     def mark_current_as_unfamiliar(self) -> None:
         """Mark the current word as unfamiliar."""
@@ -167,7 +197,7 @@ class QuizSession:
     
     def is_complete(self) -> bool:
         """Check if the quiz is complete."""
-        return all(q.answered_correctly is not None or q.skipped for q in self.questions)
+        return self._resolved >= len(self.questions)
     
     def get_results(self) -> Dict[str, float]:
         """Get quiz results."""
@@ -175,7 +205,7 @@ class QuizSession:
         total_questions = len(answered_questions)
         correct_answers = sum(1 for q in answered_questions if q.answered_correctly)
         score_percentage = (correct_answers / total_questions) * 100 if total_questions > 0 else 0
-        time_taken = (datetime.utcnow() - self.start_time).total_seconds()
+        time_taken = time.perf_counter() - self._t0
         
         return {
             "total_questions": total_questions,
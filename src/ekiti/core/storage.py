@@ -1,20 +1,69 @@
 import json
+import orjson
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, TypeVar, Generic, Type
-from pydantic import BaseModel
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, TypeVar, Generic, Type, cast
+from pydantic import BaseModel, TypeAdapter
 import sqlite3
 from datetime import datetime
+import atexit
 import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from ekiti.models.word import WordEntry, LanguageCode
+try:
+    # libyaml C bindings, several times faster than the pure-Python versions
+    from yaml import CSafeDumper as YAMLDumper, CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YAMLDumper, SafeLoader as YAMLLoader
+
+from ekiti.models.word import LanguageCode, WordEntry
 
 T = TypeVar('T', bound=BaseModel)
 
+# Validates a whole language file in a single pydantic-core call
+_entries_adapter = TypeAdapter(Dict[str, WordEntry])
+
+# Marks a JSON Lines record that deletes the entry with its ID
+_TOMBSTONE = "deleted"
+
+# (word, English translation or "", familiarity, last practiced)
+WordSummary = Tuple[str, str, float, Optional[datetime]]
+
+def _intern_entry(entry: WordEntry) -> WordEntry:
+    """Intern the repeated strings of an entry.
+    
+    Language codes, parts of speech and tags repeat across almost every
+    entry, and English glosses repeat across languages ("book" for both
+    "Buch" and "libro"), so interning them makes all entries share a
+    single copy.
+    """
+    entry.language = cast(LanguageCode, sys.intern(entry.language))
+    entry.translations = {
+        cast(LanguageCode, sys.intern(lang)): sys.intern(text)
+        for lang, text in entry.translations.items()
+    }
+    entry.en_translation = entry.translations.get("en", "")
+    entry.tags = [sys.intern(tag) for tag in entry.tags]
+    details = entry.details
+    if details.part_of_speech:
+        details.part_of_speech = sys.intern(details.part_of_speech)
+    if details.gender:
+        details.gender = sys.intern(details.gender)
+    return entry
+
 class StorageError(Exception):
     """Base exception for storage-related errors."""
     pass
 
+def _encode_record(record: dict) -> bytes:
+    """Serialize one JSON Lines record; every record must carry an ID."""
+    if record.get("id") is None:
+        raise StorageError(f"Refusing to write a record without an id: {record}")
+    return orjson.dumps(record) + b"\n"
+
 class BaseStorage(Generic[T]):
     """Base storage interface."""
     def __init__(self, model: Type[T]):
@@ -23,6 +72,9 @@ class BaseStorage(Generic[T]):
     def save(self, item: T) -> T:
         raise NotImplementedError
     
+    def save_many(self, items: Iterable[T]) -> List[T]:
+        return [self.save(item) for item in items]
+    
     def get(self, item_id: str) -> Optional[T]:
         raise NotImplementedError
     
@@ -32,47 +84,35 @@ class BaseStorage(Generic[T]):
     def delete(self, item_id: str) -> bool:
         raise NotImplementedError
 
-class YAMLStorage(BaseStorage[WordEntry]):
-    """YAML-based storage implementation."""
+def _dump_yaml(data: Dict[str, dict], f) -> None:
+    """Write id -> entry dicts as human-readable YAML."""
+    yaml.dump(
+        data,
+        f,
+        Dumper=YAMLDumper,
+        allow_unicode=True,
+        sort_keys=False,
+        default_flow_style=False
+    )
+
+class _FileStorage(BaseStorage[WordEntry]):
+    """File-backed storage that keeps all entries in memory, keyed by ID."""
     
     def __init__(self, file_path: str):
         super().__init__(WordEntry)
         self.file_path = Path(file_path)
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self._data: Dict[str, WordEntry] = {}
-        self._load()
-    
-    def _load(self):
-        """Load data from YAML file."""
-        if self.file_path.exists():
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                raw_data = yaml.safe_load(f) or {}
-                self._data = {
-                    k: WordEntry(**v) 
-                    for k, v in raw_data.items()
-                }
-    
-    def _save_to_disk(self):
-        """Save data to YAML file."""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(
-                {k: v.dict() for k, v in self._data.items()},
-                f,
-                allow_unicode=True,
-                sort_keys=False,
-                default_flow_style=False
-            )
     
-    def save(self, entry: WordEntry) -> WordEntry:
-        """Save a word entry."""
+    def _put(self, entry: WordEntry) -> WordEntry:
+        """Stamp an entry and store it in memory without touching disk."""
         if not entry.id:
             entry.id = len(self._data) + 1
         
         entry.last_reviewed = datetime.utcnow()
         entry.review_count += 1
         
-        self._data[str(entry.id)] = entry
-        self._save_to_disk()
+        self._data[str(entry.id)] = _intern_entry(entry)
         return entry
     
     def get(self, word_id: str) -> Optional[WordEntry]:
@@ -83,12 +123,238 @@ class YAMLStorage(BaseStorage[WordEntry]):
         """List all word entries."""
         return list(self._data.values())
     
+    def list_summary(self) -> List[WordSummary]:
+        """List (word, English translation, familiarity, last practiced) rows."""
+        return [
+            (e.word, e.en_translation, e.familiarity, e.last_practiced)
+            for e in self._data.values()
+        ]
+    
+    def export_yaml(self, file_path: str) -> None:
+        """Write all entries to a human-readable YAML file."""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            _dump_yaml({k: v.model_dump() for k, v in self._data.items()}, f)
+
+class YAMLStorage(_FileStorage):
+    """Read-only access to files written by the old YAML backend.
+    
+    Only used to import legacy data; new data is stored by JSONLStorage.
+    """
+    
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._load()
+    
+    def _load(self):
+        """Load data from YAML file."""
+        if self.file_path.exists():
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                raw_data = yaml.load(f, Loader=YAMLLoader) or {}
+                self._data = {
+                    k: _intern_entry(v)
+                    for k, v in _entries_adapter.validate_python(raw_data).items()
+                }
+
+class JSONLStorage(_FileStorage):
+    """Append-only JSON Lines storage implementation.
+    
+    Every save appends one line per entry and the last line for an ID
+    wins; deletes append a tombstone. The file is only rewritten by
+    compact(), which runs once stale lines exceed COMPACT_RATIO.
+    
+    Files written by Ekiti itself can be opened with trusted=True to
+    build entries without re-running pydantic validation on every load.
+    
+    Appends are serialized by the caller and written by a background
+    thread, so a save returns once memory is updated. The log is drained
+    before compaction and at interpreter exit, when it is also fsynced.
+    """
+    
+    COMPACT_RATIO = 0.3
+    # Pending writes allowed before save() blocks on the writer thread
+    WRITE_QUEUE_SIZE = 64
+    
+    def __init__(self, file_path: str, trusted: bool = False):
+        super().__init__(file_path)
+        self.trusted = trusted
+        self._lines = 0
+        self._torn = False  # last line was cut short by a crash
+        self._needs_newline = False  # file does not end with a newline
+        self._load()
+        # Opened on the first append, so reading never creates the file
+        self._log: Optional[BinaryIO] = None
+        self._writes: "queue.Queue[Optional[bytes]]" = queue.Queue(self.WRITE_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[Exception] = None
+        self._closed = False
+        if self._torn:
+            self.compact()
+        else:
+            self._maybe_compact()
+    
+    def _load(self):
+        """Replay the log into memory."""
+        if not self.file_path.exists():
+            return
+        raw_data: Dict[str, dict] = {}
+        with open(self.file_path, 'rb') as f:
+            content = f.read()
+        self._needs_newline = bool(content) and not content.endswith(b"\n")
+        lines = [line for line in content.split(b"\n") if line.strip()]
+        for i, line in enumerate(lines):
+            self._lines += 1
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                if i < len(lines) - 1:
+                    raise StorageError(f"Corrupt line {i + 1} in {self.file_path}: {e}") from e
+                # An append cut short by a crash; compaction drops it
+                self._torn = True
+                continue
+            if record.get(_TOMBSTONE):
+                raw_data.pop(str(record["id"]), None)
+            else:
+                raw_data[str(record["id"])] = record
+        if self.trusted:
+            entries = {k: WordEntry.from_trusted_dict(v) for k, v in raw_data.items()}
+        else:
+            entries = _entries_adapter.validate_python(raw_data)
+        self._data = {k: _intern_entry(v) for k, v in entries.items()}
+    
+    def _append(self, records: Iterable[dict]) -> None:
+        """Queue records for the writer thread as a single write."""
+        self._check_open()
+        lines = [_encode_record(record) for record in records]
+        self._lines += len(lines)
+        if self._log is None:
+            self._log = open(self.file_path, 'ab', buffering=1 << 16)
+        if self._needs_newline:
+            # Don't glue the first new record onto an unterminated last line
+            lines.insert(0, b"\n")
+            self._needs_newline = False
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_loop,
+                name=f"ekiti-writer-{self.file_path.stem}",
+                daemon=True,
+            )
+            self._writer.start()
+            atexit.register(self.close)
+        self._writes.put(b"".join(lines))
+    
+    def _write_loop(self) -> None:
+        """Write queued chunks to the log until the None sentinel arrives."""
+        while True:
+            chunk = self._writes.get()
+            try:
+                if chunk is None:
+                    return
+                assert self._log is not None
+                self._log.write(chunk)
+                self._log.flush()
+            except Exception as e:  # reported by the next _flush()
+                self._write_error = e
+            finally:
+                self._writes.task_done()
+    
+    def _flush(self) -> None:
+        """Wait until every queued write has reached the file."""
+        if self._writer is not None:
+            self._writes.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise StorageError(f"Error writing to {self.file_path}: {error}") from error
+    
+    def flush(self) -> None:
+        """Block until every save so far is on disk.
+        
+        Raises StorageError if a background write failed; call this before
+        reporting success to the user.
+        """
+        self._check_open()
+        self._flush()
+    
+    def _check_open(self) -> None:
+        """Refuse writes once close() has run."""
+        if self._closed:
+            raise StorageError(f"Storage {self.file_path} is closed")
+    
+    def close(self) -> None:
+        """Drain pending writes, fsync and close the log."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._flush()
+        finally:
+            if self._writer is not None:
+                self._writes.put(None)
+                self._writer.join()
+                self._writer = None
+                atexit.unregister(self.close)
+            if self._log is not None:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._log.close()
+                self._log = None
+    
+    def _maybe_compact(self) -> None:
+        """Compact the log once too many of its lines are stale."""
+        stale = self._lines - len(self._data)
+        if stale > self._lines * self.COMPACT_RATIO:
+            self.compact()
+    
+    def compact(self) -> None:
+        """Rewrite the log with exactly one line per live entry."""
+        self._flush()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            for entry in self._data.values():
+                f.write(_encode_record(entry.model_dump()))
+        os.replace(tmp_path, self.file_path)
+        self._lines = len(self._data)
+        self._torn = self._needs_newline = False
+    
+    def _replace_all(self, entries: Iterable[WordEntry]) -> None:
+        """Replace all entries as-is, without stamping them as reviewed.
+        
+        Entries without an ID, or whose ID is already taken, get a fresh
+        one, so that none of them is lost when keyed by ID.
+        """
+        entries = list(entries)
+        next_id = max((e.id for e in entries if e.id), default=0) + 1
+        data: Dict[str, WordEntry] = {}
+        for entry in entries:
+            if not entry.id or str(entry.id) in data:
+                entry.id = next_id
+                next_id += 1
+            data[str(entry.id)] = _intern_entry(entry)
+        self._data = data
+        self.compact()
+    
+    def save(self, entry: WordEntry) -> WordEntry:
+        """Save a word entry."""
+        return self.save_many([entry])[0]
+    
+    def save_many(self, entries: Iterable[WordEntry]) -> List[WordEntry]:
+        """Save several word entries, appending them in one write."""
+        self._check_open()
+        saved = [self._put(entry) for entry in entries]
+        if saved:
+            self._append(entry.model_dump() for entry in saved)
+        return saved
+    
     def delete(self, word_id: str) -> bool:
         """Delete a word entry by ID."""
+        self._check_open()
         word_id_str = str(word_id)
         if word_id_str in self._data:
             del self._data[word_id_str]
-            self._save_to_disk()
+            self._append([{"id": int(word_id_str), _TOMBSTONE: True}])
+            self._maybe_compact()
             return True
         return False
 
@@ -97,21 +363,57 @@ class StorageManager:
     
     def __init__(self, data_dir: str = None):
         self.data_dir = data_dir or os.path.expanduser("~/.config/ekiti")
-        self.storages: Dict[str, BaseStorage] = {}
+        self.storages: Dict[str, JSONLStorage] = {}
+        # One lock per language, so each file is opened (and migrated) once
+        # while different languages can still load in parallel
+        self._lang_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()  # guards _lang_locks
     
-    def get_storage(self, language: str) -> BaseStorage[WordEntry]:
+    def _make_storage(self, language: str) -> JSONLStorage:
+        """Open the storage file for a language."""
+        storage_path = Path(self.data_dir) / f"{language}.jsonl"
+        legacy_path = storage_path.with_suffix(".yaml")
+        if storage_path.exists() or not legacy_path.exists():
+            return JSONLStorage(str(storage_path), trusted=True)
+        
+        # One-off import of a file written by the old YAML backend. The YAML
+        # is fully loaded first, and compact() only moves the new file into
+        # place once it is complete, so a failed import leaves no .jsonl
+        # behind and is retried on the next run.
+        legacy_entries = YAMLStorage(str(legacy_path)).list()
+        storage = JSONLStorage(str(storage_path), trusted=True)
+        storage._replace_all(legacy_entries)
+        return storage
+    
+    def get_storage(self, language: str) -> JSONLStorage:
         """Get or create a storage instance for a language."""
-        if language not in self.storages:
-            storage_path = Path(self.data_dir) / f"{language}.yaml"
-            self.storages[language] = YAMLStorage(str(storage_path))
-        return self.storages[language]
+        storage = self.storages.get(language)
+        if storage is None:
+            with self._lock:
+                lang_lock = self._lang_locks.setdefault(language, threading.Lock())
+            with lang_lock:
+                storage = self.storages.get(language)
+                if storage is None:
+                    storage = self._make_storage(language)
+                    self.storages[language] = storage
+        return storage
     
     def get_all_words(self) -> List[WordEntry]:
         """Get all words from all language storages."""
+        with os.scandir(self.data_dir) as entries:
+            lang_codes = sorted({
+                Path(entry.name).stem
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(('.jsonl', '.yaml'))
+            })
+        
+        # Load the languages that are not open yet in parallel
+        missing = [lang for lang in lang_codes if lang not in self.storages]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                list(executor.map(self.get_storage, missing))
+        
         all_words = []
-        for lang in os.listdir(self.data_dir):
-            if lang.endswith('.yaml'):
-                lang_code = lang[:-5]  # Remove .yaml
-                storage = self.get_storage(lang_code)
-                all_words.extend(storage.list())
+        for lang_code in lang_codes:
+            all_words.extend(self.storages[lang_code].list())
         return all_words
@@ -0,0 +1,20 @@
+"""Sample vocabulary shipped with Ekiti."""
+import pkgutil
+from typing import List
+
+from pydantic import TypeAdapter
+
+from ekiti.models.word import WordEntry
+
+# Languages with a bundled seed_<code>.json file
+SEED_LANGUAGES = ("de", "es", "id")
+
+_word_list = TypeAdapter(List[WordEntry])
+
+def load_seed_words(language: str) -> List[WordEntry]:
+    """Load the sample vocabulary for a language."""
+    # pkgutil rather than importlib.resources.files(), which needs 3.9+
+    blob = pkgutil.get_data(__name__, f"seed_{language}.json")
+    if blob is None:
+        raise FileNotFoundError(f"No seed data for language: {language}")
+    return _word_list.validate_json(blob)
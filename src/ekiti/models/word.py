@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 LanguageCode = Literal["en", "de", "es", "id", "taigi"]
 DifficultyLevel = Literal[1, 2, 3, 4, 5]
 
+# WordEntry fields stored as ISO 8601 strings in JSON
+_DATETIME_FIELDS = ("created_at", "last_reviewed", "last_practiced")
+
 class Translation(BaseModel):
     """Represents a translation of a word in a specific language."""
     language: LanguageCode
@@ -12,11 +15,15 @@ class Translation(BaseModel):
     
 class Example(BaseModel):
     """Example sentence with its translation."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     sentence: str
     translation: str
 
 class WordDetails(BaseModel):
     """Additional details about a word."""
+    model_config = ConfigDict(extra="ignore")
+    
     gender: Optional[str] = None  # For languages with grammatical gender
     plural: Optional[str] = None
     part_of_speech: Optional[str] = None
@@ -37,9 +44,32 @@ class WordEntry(BaseModel):
     review_count: int = 0
     familiarity: float = 0.0  # 0.0 (not familiar) to 1.0 (fully familiar)
     last_practiced: Optional[datetime] = None
+    # Cached translations["en"]; filled in after construction, never stored
+    en_translation: str = Field(default="", exclude=True)
+    
+    def model_post_init(self, __context) -> None:
+        if not self.en_translation:
+            self.en_translation = self.translations.get("en", "")
+    
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "WordEntry":
+        """Build an entry from a record Ekiti wrote itself, skipping validation.
+        
+        Only for storage load paths; user input goes through WordEntry(...).
+        """
+        for field in _DATETIME_FIELDS:
+            value = data.get(field)
+            if isinstance(value, str):
+                data[field] = datetime.fromisoformat(value)
+        data["details"] = WordDetails.model_construct(**(data.get("details") or {}))
+        data["examples"] = [Example.model_construct(**e) for e in data.get("examples", ())]
+        return cls.model_construct(**data)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        # Storage updates review fields in place; don't re-run validators
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "word": "Buch",
                 "language": "de",
@@ -59,3 +89,4 @@ class WordEntry(BaseModel):
                 "difficulty": 2
             }
         }
+    )
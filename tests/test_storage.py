@@ -0,0 +1,208 @@
+"""Tests for the JSON Lines word storage."""
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from ekiti.core.storage import (
+    JSONLStorage,
+    StorageError,
+    StorageManager,
+    _dump_yaml,
+)
+from ekiti.models.word import Example, WordEntry
+
+
+def _entry(word: str, en: str, **fields) -> WordEntry:
+    return WordEntry(word=word, language="de", translations={"en": en}, **fields)
+
+
+def _line_count(path: Path) -> int:
+    return len(path.read_bytes().splitlines())
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    return tmp_path / "de.jsonl"
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_round_trip(log_path: Path, trusted: bool):
+    store = JSONLStorage(str(log_path))
+    buch = store.save(_entry(
+        "Buch", "book",
+        tags=["noun"],
+        examples=[
+            Example(sentence="Ich lese ein Buch.", translation="I'm reading a book.")
+        ],
+    ))
+    haus = store.save(_entry("Haus", "house"))
+    buch.familiarity = 0.5
+    store.save(buch)
+    assert store.delete(str(haus.id))
+    store.close()
+
+    reloaded = JSONLStorage(str(log_path), trusted=trusted)
+    assert [e.word for e in reloaded.list()] == ["Buch"]
+    loaded = reloaded.get(str(buch.id))
+    assert loaded.model_dump() == buch.model_dump()
+    assert loaded.en_translation == "book"
+    assert loaded.examples[0].sentence == "Ich lese ein Buch."
+    reloaded.close()
+
+
+def test_validated_load_rejects_bad_records(log_path: Path):
+    log_path.write_bytes(
+        b'{"id":1,"word":"Buch","language":"de","translations":{"en":"book"},'
+        b'"difficulty":9}\n'
+    )
+    # Trusted loading skips validation entirely
+    assert JSONLStorage(str(log_path), trusted=True).get("1").difficulty == 9
+    with pytest.raises(ValidationError):
+        JSONLStorage(str(log_path))
+
+
+def test_compaction_threshold(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    buch = store.save_many([_entry(f"w{i}", f"e{i}") for i in range(4)])[0]
+    store.close()
+    assert _line_count(log_path) == 4
+
+    # One stale line out of five stays below COMPACT_RATIO
+    store = JSONLStorage(str(log_path))
+    store.save(store.get(str(buch.id)))
+    store.close()
+    JSONLStorage(str(log_path)).close()
+    assert _line_count(log_path) == 5
+
+    # Two out of six does not, so the next open rewrites the file
+    store = JSONLStorage(str(log_path))
+    store.save(store.get(str(buch.id)))
+    store.close()
+    store = JSONLStorage(str(log_path))
+    assert _line_count(log_path) == 4
+    assert len(store.list()) == 4
+    store.close()
+
+
+def test_delete_compacts(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    entries = store.save_many([_entry(f"w{i}", f"e{i}") for i in range(3)])
+    store.delete(str(entries[0].id))
+    store.delete(str(entries[1].id))
+    store.close()
+    assert _line_count(log_path) == 1
+    assert [e.word for e in JSONLStorage(str(log_path)).list()] == ["w2"]
+
+
+def test_reading_does_not_create_file(log_path: Path):
+    JSONLStorage(str(log_path)).close()
+    assert not log_path.exists()
+
+
+def test_migrates_yaml_written_by_old_backend(tmp_path: Path):
+    entries = [_entry("Buch", "book", id=1), _entry("Haus", "house", id=2)]
+    with open(tmp_path / "de.yaml", "w", encoding="utf-8") as f:
+        _dump_yaml({str(e.id): e.model_dump() for e in entries}, f)
+
+    store = StorageManager(str(tmp_path)).get_storage("de")
+    assert [e.model_dump() for e in store.list()] == [e.model_dump() for e in entries]
+    store.close()
+    assert _line_count(tmp_path / "de.jsonl") == 2
+
+
+def test_migrates_yaml_entries_without_ids(tmp_path: Path):
+    (tmp_path / "de.yaml").write_text(
+        "buch:\n  word: Buch\n  language: de\n  translations: {en: book}\n"
+        "haus:\n  word: Haus\n  language: de\n  translations: {en: house}\n",
+        encoding="utf-8",
+    )
+    store = StorageManager(str(tmp_path)).get_storage("de")
+    assert sorted(e.word for e in store.list()) == ["Buch", "Haus"]
+    assert len({e.id for e in store.list()}) == 2
+    assert all(e.id is not None for e in store.list())
+    store.close()
+
+
+def test_failed_migration_leaves_yaml_in_charge(tmp_path: Path):
+    yaml_path = tmp_path / "de.yaml"
+    yaml_path.write_text(
+        "'1':\n  id: 1\n  word: Buch\n  language: de\n"
+        "  translations: {en: book}\n  difficulty: 9\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(ValidationError):
+        StorageManager(str(tmp_path)).get_storage("de")
+    assert not (tmp_path / "de.jsonl").exists()
+
+    yaml_path.write_text(yaml_path.read_text().replace("9", "2"), encoding="utf-8")
+    store = StorageManager(str(tmp_path)).get_storage("de")
+    assert [e.word for e in store.list()] == ["Buch"]
+    store.close()
+
+
+def test_torn_last_line_is_dropped(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    store.save_many([_entry("Buch", "book"), _entry("Haus", "house")])
+    store.close()
+    with open(log_path, "ab") as f:
+        f.write(b'{"id":9,"word":"Tis')
+
+    store = JSONLStorage(str(log_path), trusted=True)
+    assert sorted(e.word for e in store.list()) == ["Buch", "Haus"]
+    assert log_path.read_bytes().endswith(b"}\n")
+    store.save(_entry("Tisch", "table"))
+    store.close()
+
+    words = sorted(e.word for e in JSONLStorage(str(log_path)).list())
+    assert words == ["Buch", "Haus", "Tisch"]
+
+
+def test_append_after_unterminated_line(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    store.save(_entry("Buch", "book"))
+    store.close()
+    log_path.write_bytes(log_path.read_bytes().rstrip(b"\n"))
+
+    store = JSONLStorage(str(log_path))
+    store.save(_entry("Haus", "house"))
+    store.close()
+    words = sorted(e.word for e in JSONLStorage(str(log_path)).list())
+    assert words == ["Buch", "Haus"]
+
+
+def test_corrupt_line_before_the_end_is_an_error(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    store.save(_entry("Buch", "book"))
+    store.close()
+    log_path.write_bytes(b"{not json\n" + log_path.read_bytes())
+    with pytest.raises(StorageError):
+        JSONLStorage(str(log_path))
+
+
+class _FullDisk:
+    """Stand-in log file whose writes fail."""
+
+    closed = False
+
+    def write(self, data: bytes) -> int:
+        raise OSError(28, "No space left on device")
+
+    def flush(self) -> None:
+        pass
+
+
+def test_writer_error_reaches_caller(log_path: Path):
+    store = JSONLStorage(str(log_path))
+    store.save(_entry("Buch", "book"))
+    store.flush()
+
+    real_log, store._log = store._log, _FullDisk()
+    store.save(_entry("Haus", "house"))
+    with pytest.raises(StorageError, match="No space left"):
+        store.flush()
+
+    store._log = real_log
+    store.close()
+    with pytest.raises(StorageError):
+        store.save(_entry("Tisch", "table"))